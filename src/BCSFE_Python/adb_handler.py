@@ -8,6 +8,9 @@ from typing import Union
 
 from . import helper, user_input_handler, config_manager
 
+# whether the adb server has been started as root for this session
+adb_ready = False
+
 
 class ADBExceptionTypes(enum.Enum):
     """ADB exception types"""
@@ -79,20 +82,34 @@ def adb_push(package_name: str, local_file_path: str, device_file_path: str):
 def adb_delete_file(package_name: str, device_file_path: str, options: str = ""):
     """Delete a file on a device"""
 
+    adb_shell([get_delete_command(package_name, device_file_path, options)])
+
+
+def get_delete_command(
+    package_name: str, device_file_path: str, options: str = ""
+) -> str:
+    """Get the shell command to delete a file on a device"""
+
     path = f"/data/data/{package_name}/{device_file_path}"
-    run_adb_command(f'shell "su 0 rm "{path}" {options}"')
+    return f"su 0 rm {path} {options}"
 
 
 def adb_close_process(package_name: str):
     """Close a process"""
 
-    run_adb_command(f"shell am force-stop {package_name}")
+    adb_shell([f"am force-stop {package_name}"])
 
 
 def adb_run_process(package_name: str):
     """Run a process"""
 
-    run_adb_command(f"shell monkey -p {package_name} -v 1")
+    adb_shell([f"monkey -p {package_name} -v 1"])
+
+
+def adb_shell(commands: list[str]):
+    """Run shell commands on a device with a single adb call, stopping at the first failure"""
+
+    run_adb_command(f'shell "{" && ".join(commands)}"')
 
 
 def adb_reboot():
@@ -134,11 +151,14 @@ def is_adb_installed():
 def run_adb_command(command: str) -> bool:
     """Run an ADB command"""
 
+    global adb_ready
     command = f"adb {command}"
-    if not is_adb_installed():
+    if not adb_ready and not is_adb_installed():
         raise ADBException(ADBExceptionTypes.ADB_NOT_INSTALLED)
     try:
-        adb_root()
+        if not adb_ready:
+            adb_root()
+            adb_ready = True
         subprocess.run(command, shell=True, check=True, text=True, capture_output=True)
     except subprocess.CalledProcessError as err:
         adb_error_handler(err)
@@ -148,6 +168,8 @@ def run_adb_command(command: str) -> bool:
 def adb_kill_server():
     """Kill ADB server"""
 
+    global adb_ready
+    adb_ready = False
     try:
         subprocess.run(
             "adb kill-server", shell=True, check=True, text=True, capture_output=True
@@ -316,9 +338,9 @@ def rerun_game(game_version: str) -> None:
         "Rerunning game...",
         base=helper.DARK_YELLOW,
     )
+    package_name = get_package_name(game_version)
     try:
-        adb_close_process(get_package_name(game_version))
-        adb_run_process(get_package_name(game_version))
+        adb_shell([f"am force-stop {package_name}", f"monkey -p {package_name} -v 1"])
     except ADBException as err:
         adb_err_handler(err)
 
@@ -326,9 +348,14 @@ def rerun_game(game_version: str) -> None:
 def adb_clear_save_data(game_version: str) -> None:
     """Clear save data"""
 
+    package_name = get_package_name(game_version)
     try:
-        adb_delete_file(get_package_name(game_version), "/files/*SAVE_DATA*")
-        adb_delete_file(get_package_name(game_version), "/shared_prefs", "-r -f")
+        adb_shell(
+            [
+                get_delete_command(package_name, "/files/*SAVE_DATA*"),
+                get_delete_command(package_name, "/shared_prefs", "-r -f"),
+            ]
+        )
     except ADBException as err:
         adb_err_handler(err)
 
@@ -1,7 +1,10 @@
 """Handler for parsing CSV files."""
 
 
-from typing import Any
+import re
+import sys
+
+COMMENT_PATTERN = re.compile(r"//.*")
 
 
 def remove_pkcs7_padding(data: bytes) -> bytes:
@@ -19,35 +22,42 @@ def remove_pkcs7_padding(data: bytes) -> bytes:
     return data[:-padding_length]
 
 
+def get_lines(data: str) -> list[str]:
+    """Get the non-empty lines of data with in-line comments removed."""
+
+    # most game data files have no comments, so avoid copying the whole text
+    if "//" in data:
+        data = COMMENT_PATTERN.sub("", data)
+    return [line for line in map(str.strip, data.split("\n")) if line]
+
+
 def remove_comments(data: str) -> str:
     """Remove in-line comments from data."""
 
-    data_ls = data.split("\n")
-    data_ls = [line.split("//")[0] for line in data_ls]
-    data_ls = [line.strip() for line in data_ls]
-    data_ls = [line for line in data_ls if line != ""]
-    return "\n".join(data_ls)
+    return "\n".join(get_lines(data))
 
 
 def parse_csv(data: str, delimeter: str = ",") -> list[list[str]]:
     """Parse CSV data."""
 
-    data = remove_comments(data)
-    data_ls = data.split("\n")
-    data_ls_ls = [line.split(delimeter) for line in data_ls]
-    data_ls_ls = remove_empty_items(data_ls_ls)
-    data_ls_ls = [line for line in data_ls_ls if line != []]
+    # intern the cells so repeated values like "0" and "-1" share one string
+    intern = sys.intern
+    data_ls_ls: list[list[str]] = []
+    for line in get_lines(data):
+        line_ls = [intern(item) for item in line.split(delimeter) if item]
+        if line_ls:
+            data_ls_ls.append(line_ls)
     return data_ls_ls
 
 
-def remove_empty_items(data: list[list[Any]]) -> list[list[Any]]:
-    """Remove empty items from a list of lists."""
+def parse_csv_first_column(data: str, delimeter: str = ",") -> list[str]:
+    """Parse only the first non-empty item of each CSV row."""
 
-    data_ls: list[list[Any]] = []
-    for line in data:
-        line_ls: list[Any] = []
-        for item in line:
-            if item != "":
-                line_ls.append(item)
-        data_ls.append(line_ls)
-    return data_ls
+    first_items: list[str] = []
+    for line in get_lines(data):
+        item, _, rest = line.partition(delimeter)
+        while not item and rest:
+            item, _, rest = rest.partition(delimeter)
+        if item:
+            first_items.append(item)
+    return first_items
@@ -1,7 +1,7 @@
 """Handler for selecting cat ids"""
 
+import concurrent.futures
 import os
-from multiprocessing import Process
 from typing import Any, Callable, Optional
 
 
@@ -212,11 +212,11 @@ def filter_cat_names(
     Returns:
         list[tuple[str, int, int]]: filtered cat names
     """
-    filtered_cat_ids: list[int] = []
+    filtered_cat_ids: set[int] = set()
     cat_data: list[tuple[str, int, int]] = []
     for cat_name, cat_id, cat_form in cat_names:
         if cat_id not in filtered_cat_ids:
-            filtered_cat_ids.append(cat_id)
+            filtered_cat_ids.add(cat_id)
             cat_data.append((cat_name, cat_id, cat_form))
 
     return cat_data
@@ -244,16 +244,15 @@ def search_cat_names(
     return found_names
 
 
-def download_10_files(game_version: str, file_names: list[str]) -> None:
+def download_name_file(game_version: str, file_name: str) -> None:
     """
-    Download 10 files
+    Download a cat name file
 
     Args:
         game_version (str): game version
-        file_names (list[str]): file names
+        file_name (str): file name
     """
-    for file_name in file_names:
-        game_data_getter.download_file(game_version, "resLocal", file_name, False)
+    game_data_getter.download_file(game_version, "resLocal", file_name, False)
 
 
 def get_cat_names(save_stats: dict[str, Any]) -> Optional[list[tuple[str, int, int]]]:
@@ -268,6 +267,8 @@ def get_cat_names(save_stats: dict[str, Any]) -> Optional[list[tuple[str, int, i
     """
 
     is_jp = helper.is_jp(save_stats)
+    lang = helper.get_lang(is_jp)
+    delimeter = helper.get_text_splitter(is_jp)
 
     path = game_data_getter.get_path("resLocal", "", is_jp)
     if path is None:
@@ -282,36 +283,35 @@ def get_cat_names(save_stats: dict[str, Any]) -> Optional[list[tuple[str, int, i
             "Downloading cat names for the first time... (This may take some time, but next time it will be much faster)",
             helper.GREEN,
         )
-        funcs: list[Process] = []
         version = game_data_getter.get_latest_version(is_jp)
         if version is None:
             helper.colored_text("Failed to get cat names", helper.RED)
             return None
-        all_file_names: list[str] = []
-        for cat_id, _ in enumerate(save_stats["cats"]):
-            file_name = f"Unit_Explanation{cat_id+1}_{helper.get_lang(is_jp)}.csv"
-            all_file_names.append(file_name)
-        file_names_split = helper.chunks(all_file_names, 10)
-        for file_names in file_names_split:
-            funcs.append(
-                Process(
-                    target=download_10_files,
-                    args=(version, file_names),
+        all_file_names = [
+            f"Unit_Explanation{cat_id+1}_{lang}.csv"
+            for cat_id in range(len(save_stats["cats"]))
+        ]
+        # one task per file so idle threads pick up the next file from the pool's
+        # shared queue instead of waiting on a fixed chunk
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            # list() so that any download errors are raised here
+            list(
+                executor.map(
+                    download_name_file,
+                    [version] * len(all_file_names),
+                    all_file_names,
                 )
             )
-        helper.run_in_parallel(funcs)
 
     names: list[tuple[str, int, int]] = []
     for cat_id, _ in enumerate(save_stats["cats"]):
         file_path = os.path.join(
-            file_path_dir, f"Unit_Explanation{cat_id+1}_{helper.get_lang(is_jp)}.csv"
+            file_path_dir, f"Unit_Explanation{cat_id+1}_{lang}.csv"
         )
-        data = csv_handler.parse_csv(
-            helper.read_file_string(file_path),
-            delimeter=helper.get_text_splitter(is_jp),
+        form_names = csv_handler.parse_csv_first_column(
+            helper.read_file_string(file_path), delimeter=delimeter
         )
-        for form_id, form in enumerate(data):
-            name = form[0]
+        for form_id, name in enumerate(form_names):
             names.append((name, cat_id, form_id))
     return names
 
@@ -88,13 +88,13 @@ def edit_cat_cannon(save_stats: dict[str, Any]) -> dict[str, Any]:
         if i == 0:
             extra_data.append(f"Level: &{levels['effect']+1}&")
             continue
-        string = ""
+        parts: list[str] = []
         for level_str, level in levels.items():
             part_id = get_part_id_from_str(level_str)
             if part_id == 0:
                 level += 1
-            string += f"{level_str.title()}: &{level}&, "
-        string = string[:-2]
+            parts.append(f"{level_str.title()}: &{level}&")
+        string = ", ".join(parts)
         string += f" (Development: &{cannons[i]['unlock_flag']}&)"
         extra_data.append(string)
 
@@ -16,6 +16,12 @@ CHAPTERS = [
     "Cats of the Cosmos 2",
     "Cats of the Cosmos 3",
 ]
+# index of each chapter in the save, which has a gap after EoC 3
+STORY_CHAPTER_IDS = (0, 1, 2, 4, 5, 6, 7, 8, 9)
+# colored header shown before editing each chapter
+CHAPTER_HEADERS = tuple(
+    f"Chapter: &{chapter_id+1}& : &{name}&" for chapter_id, name in enumerate(CHAPTERS)
+)
 
 
 def clear_specific_level_ids(
@@ -28,15 +34,12 @@ def clear_specific_level_ids(
         story_chapters["Chapter Progress"][chapter_id] = 0
         story_chapters["Times Cleared"][chapter_id] = [0] * 51
     else:
-        stage_index = progress - 1
         story_chapters["Chapter Progress"][chapter_id] = progress
-        # set all levels before the one being cleared to 1
-        story_chapters["Times Cleared"][chapter_id][stage_index] = 1
-        for i in range(stage_index):
-            story_chapters["Times Cleared"][chapter_id][i] = 1
+        times_cleared = story_chapters["Times Cleared"][chapter_id]
+        # set the level being cleared and all levels before it to 1
+        times_cleared[:progress] = [1] * progress
         # set all levels after the one being cleared to 0
-        for i in range(stage_index + 1, get_total_stages(save_stats, chapter_id) + 3):
-            story_chapters["Times Cleared"][chapter_id][i] = 0
+        times_cleared[progress:] = [0] * (len(times_cleared) - progress)
 
     save_stats["story_chapters"] = story_chapters
     return save_stats
@@ -61,18 +64,13 @@ def has_cleared_chapter(save_stats: dict[str, Any], chapter_id: int) -> bool:
 def format_story_ids(ids: list[int]) -> list[int]:
     """For some reason there is a gap after EoC 3. This adds that"""
 
-    formatted_ids: list[int] = []
-    for story_id in ids:
-        formatted_ids.append(format_story_id(story_id))
-    return formatted_ids
+    return [format_story_id(story_id) for story_id in ids]
 
 
 def format_story_id(chapter_id: int) -> int:
     """For some reason there is a gap after EoC 3. This adds that"""
 
-    if chapter_id > 2:
-        chapter_id += 1
-    return chapter_id
+    return STORY_CHAPTER_IDS[chapter_id]
 
 
 def clear_levels(
@@ -85,11 +83,11 @@ def clear_levels(
 ) -> tuple[dict[str, Any], list[list[int]]]:
     """Clear levels in a chapter"""
 
+    # 48 stages followed by 3 unused slots
+    times_cleared = [val] * chapter_progress + [0] * (51 - chapter_progress)
     for chapter_id in ids:
         story_chapters["Chapter Progress"][chapter_id] = chapter_progress
-        story_chapters["Times Cleared"][chapter_id] = (
-            ([val] * chapter_progress) + ([0] * (48 - chapter_progress)) + ([0] * 3)
-        )
+        story_chapters["Times Cleared"][chapter_id] = times_cleared.copy()
         if not clear:
             treasures[chapter_id] = [0] * 49
     return story_chapters, treasures
@@ -107,7 +105,7 @@ def clear_each(save_stats: dict[str, Any]):
     chapter_ids = story_level_id_selector.select_specific_chapters()
 
     for chapter_id in chapter_ids:
-        helper.colored_text(f"Chapter: &{chapter_id+1}& : &{CHAPTERS[chapter_id]}&")
+        helper.colored_text(CHAPTER_HEADERS[chapter_id])
         formatted_id = format_story_id(chapter_id)
         progress = story_level_id_selector.select_level_progress(
             chapter_id, get_total_stages(save_stats, formatted_id)
@@ -121,10 +119,8 @@ def clear_all(save_stats: dict[str, Any]) -> dict[str, Any]:
     """Clear whole chapters"""
 
     chapter_ids = story_level_id_selector.select_specific_chapters()
-    text = ""
-    for chapter_id in chapter_ids:
-        text += f"Chapter: &{chapter_id+1}& : &{CHAPTERS[chapter_id]}&\n"
-    helper.colored_text(text.strip("\n"))
+    text = "\n".join(CHAPTER_HEADERS[chapter_id] for chapter_id in chapter_ids)
+    helper.colored_text(text)
     progress = story_level_id_selector.select_level_progress(
         None, get_total_stages(save_stats, 0)
     )
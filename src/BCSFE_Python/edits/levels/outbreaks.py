@@ -8,14 +8,8 @@ from . import main_story
 def get_available_chapters(outbreaks: dict[int, Any]) -> list[str]:
     """Get available chapters"""
 
-    available_chapters: list[str] = []
-    for chapter_index in outbreaks:
-        if chapter_index > 2:
-            chapter_index -= 1
-        if chapter_index > 7:
-            continue
-        available_chapters.append(main_story.CHAPTERS[chapter_index])
-    return available_chapters
+    chapter_indexes = [index - 1 if index > 2 else index for index in outbreaks]
+    return [main_story.CHAPTERS[index] for index in chapter_indexes if index <= 7]
 
 
 def set_outbreak(
@@ -1,5 +1,5 @@
 """Handler for selecting story levels"""
-from typing import Optional
+from typing import Callable, Optional
 
 from ... import user_input_handler, helper
 from . import main_story
@@ -33,13 +33,10 @@ def select_levels(
         choice = get_option()
     else:
         choice = forced_option
-    if choice == 1:
-        return select_specific_levels(chapter_id, total)
-    if choice == 2:
-        return select_levels_up_to(chapter_id, total)
-    if choice == 3:
-        return select_all(total)
-    return []
+    selector = LEVEL_SELECTORS.get(choice)
+    if selector is None:
+        return []
+    return selector(chapter_id, total)
 
 
 def select_specific_levels(chapter_id: Optional[int], total: int) -> list[int]:
@@ -47,9 +44,7 @@ def select_specific_levels(chapter_id: Optional[int], total: int) -> list[int]:
 
     print("What levels do you want to select?")
     if chapter_id is not None:
-        helper.colored_text(
-            f"Chapter: &{chapter_id+1}& : &{main_story.CHAPTERS[chapter_id]}&"
-        )
+        helper.colored_text(main_story.CHAPTER_HEADERS[chapter_id])
     ids = user_input_handler.get_range_ids(
         "Level ids (e.g &1&=korea, &2&=mongolia)", total
     )
@@ -62,9 +57,7 @@ def select_levels_up_to(chapter_id: Optional[int], total: int) -> list[int]:
 
     print("What levels do you want to select?")
     if chapter_id is not None:
-        helper.colored_text(
-            f"Chapter: &{chapter_id+1}& : &{main_story.CHAPTERS[chapter_id]}&"
-        )
+        helper.colored_text(main_story.CHAPTER_HEADERS[chapter_id])
     stage_id = user_input_handler.get_int(
         f"Enter the stage id that you want to clear/unclear up to (and including) (e.g &1&=korea cleared, &2&=korea &and& mongolia cleared, &{total}&=all)?:"
     )
@@ -78,6 +71,14 @@ def select_all(total: int) -> list[int]:
     return list(range(0, total))
 
 
+# option from get_option -> function that selects the levels for it
+LEVEL_SELECTORS: dict[int, Callable[[Optional[int], int], list[int]]] = {
+    1: select_specific_levels,
+    2: select_levels_up_to,
+    3: lambda _, total: select_all(total),
+}
+
+
 def select_level_progress(
     chapter_id: Optional[int], total: int, examples: Optional[list[str]] = None
 ) -> int:
@@ -91,9 +92,7 @@ def select_level_progress(
 
     print("What level do you want to clear up to and including?")
     if chapter_id is not None:
-        helper.colored_text(
-            f"Chapter: &{chapter_id+1}& : &{main_story.CHAPTERS[chapter_id]}&"
-        )
+        helper.colored_text(main_story.CHAPTER_HEADERS[chapter_id])
     progress = user_input_handler.get_int(
         f"Enter the stage id that you want to clear/unclear (e.g &1&={examples[0]} cleared, &2&={examples[0]} &and& {examples[1]} cleared, &{total}&=all, &0&=unclear all)?:"
     )
@@ -1,51 +1,74 @@
 """Handler for editing main story treasures"""
+import concurrent.futures
 from typing import Any, Optional
 
 from ... import helper, user_input_handler, item, csv_handler, game_data_getter
 from . import story_level_id_selector, main_story
 
 
-def get_stages(is_jp: bool) -> Optional[list[list[list[int]]]]:
-    """Get what stages belong to which treasure group"""
-
-    treasures_values: list[list[list[int]]] = []
-    file_data = game_data_getter.get_file_latest(
-        "DataLocal", "treasureData0.csv", is_jp
-    )
+TREASURE_DATA_FILES = ["treasureData0.csv", "treasureData1.csv", "treasureData2_0.csv"]
+TREASURE_NAME_FILES = [
+    "Treasure3_0_{}.csv",
+    "Treasure3_1_AfterFirstEncounter_{}.csv",
+    "Treasure3_2_0_{}.csv",
+]
+# treasure name files with the language filled in, keyed by whether the save is jp
+TREASURE_NAME_FILE_NAMES = {
+    is_jp: [
+        file_name.format(helper.get_lang(is_jp)) for file_name in TREASURE_NAME_FILES
+    ]
+    for is_jp in (False, True)
+}
+# the stages are stored in reverse order in the save, apart from the last 2
+TREASURE_STAGE_IDS = tuple(i if i > 45 else 45 - i for i in range(48))
+# downloaded treasure groups, keyed by whether the save is jp
+TREASURE_GROUPS: dict[bool, dict[str, Any]] = {}
+
+
+def get_treasure_file(
+    pack_name: str, file_name: str, is_jp: bool, delimeter: str = ","
+) -> Optional[list[list[str]]]:
+    """Download and parse a treasure csv file"""
+
+    file_data = game_data_getter.get_file_latest(pack_name, file_name, is_jp)
     if file_data is None:
-        helper.error_text("Failed to get treasureData0.csv")
+        helper.error_text(f"Failed to get {file_name}")
         return None
-    eoc_treasures = helper.parse_int_list_list(
-        csv_handler.parse_csv(
-            file_data.decode("utf-8"),
-        )
-    )[11:22]
-    file_data = game_data_getter.get_file_latest(
-        "DataLocal", "treasureData1.csv", is_jp
-    )
-    if file_data is None:
-        helper.error_text("Failed to get treasureData1.csv")
-        return None
-    itf_treasures = helper.parse_int_list_list(
-        csv_handler.parse_csv(
-            file_data.decode("utf-8"),
-        )
-    )[11:22]
-    file_data = game_data_getter.get_file_latest(
-        "DataLocal", "treasureData2_0.csv", is_jp
-    )
-    if file_data is None:
-        helper.error_text("Failed to get treasureData2_0.csv")
-        return None
-    cotc_treasures = helper.parse_int_list_list(
-        csv_handler.parse_csv(
-            file_data.decode("utf-8"),
+    return csv_handler.parse_csv(file_data.decode("utf-8"), delimeter=delimeter)
+
+
+def get_treasure_files(
+    pack_name: str, file_names: list[str], is_jp: bool, delimeter: str = ","
+) -> Optional[list[list[list[str]]]]:
+    """Download and parse several treasure csv files concurrently"""
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        files = list(
+            executor.map(
+                lambda file_name: get_treasure_file(
+                    pack_name, file_name, is_jp, delimeter
+                ),
+                file_names,
+            )
         )
-    )[11:22]
+    treasure_files: list[list[list[str]]] = []
+    for data in files:
+        if data is None:
+            return None
+        treasure_files.append(data)
+    return treasure_files
+
+
+def get_stages(is_jp: bool) -> Optional[list[list[list[int]]]]:
+    """Get what stages belong to which treasure group"""
 
-    treasures_values.append(remove_negative_1(eoc_treasures))
-    treasures_values.append(remove_negative_1(itf_treasures))
-    treasures_values.append(remove_negative_1(cotc_treasures))
+    files = get_treasure_files("DataLocal", TREASURE_DATA_FILES, is_jp)
+    if files is None:
+        return None
+    treasures_values: list[list[list[int]]] = []
+    for data in files:
+        treasures = helper.parse_int_list_list(data[11:22])
+        treasures_values.append(remove_negative_1(treasures))
     return treasures_values
 
 
@@ -62,62 +85,32 @@ def remove_negative_1(data: list[list[int]]) -> list[list[int]]:
 def get_names(is_jp: bool) -> Optional[list[list[list[str]]]]:
     """Get the names of all of the treasure groups"""
 
-    names: list[list[list[str]]] = []
-    if is_jp:
-        country_code = "ja"
-    else:
-        country_code = "en"
-
-    file_data = game_data_getter.get_file_latest(
-        "resLocal", f"Treasure3_0_{country_code}.csv", is_jp
+    files = get_treasure_files(
+        "resLocal",
+        TREASURE_NAME_FILE_NAMES[is_jp],
+        is_jp,
+        helper.get_text_splitter(is_jp),
     )
-    if file_data is None:
-        helper.error_text(f"Failed to get Treasure3_0_{country_code}.csv")
+    if files is None:
         return None
-    eoc_names = csv_handler.parse_csv(
-        file_data.decode("utf-8"),
-        delimeter=helper.get_text_splitter(is_jp),
-    )[:11]
-
-    file_data = game_data_getter.get_file_latest(
-        "resLocal", f"Treasure3_1_AfterFirstEncounter_{country_code}.csv", is_jp
-    )
-    if file_data is None:
-        helper.error_text(
-            f"Failed to get Treasure3_1_AfterFirstEncounter_{country_code}.csv"
-        )
-        return None
-    itf_names = csv_handler.parse_csv(
-        file_data.decode("utf-8"),
-        delimeter=helper.get_text_splitter(is_jp),
-    )[:11]
-
-    file_data = game_data_getter.get_file_latest(
-        "resLocal", f"Treasure3_2_0_{country_code}.csv", is_jp
-    )
-    if file_data is None:
-        helper.error_text(f"Failed to get Treasure3_2_0_{country_code}.csv")
-        return None
-    cotc_names = csv_handler.parse_csv(
-        file_data.decode("utf-8"),
-        delimeter=helper.get_text_splitter(is_jp),
-    )[:11]
-
-    names.append(helper.copy_first_n(eoc_names, 0))
-    names.append(helper.copy_first_n(itf_names, 0))
-    names.append(helper.copy_first_n(cotc_names, 0))
-
-    return names
+    return [helper.copy_first_n(data[:11], 0) for data in files]
 
 
 def get_treasure_groups(is_jp: bool) -> Optional[dict[str, Any]]:
     """Get the names and stages of all of the treasure groups"""
 
-    treasure_stages = get_stages(is_jp)
-    treasure_names = get_names(is_jp)
+    if is_jp in TREASURE_GROUPS:
+        return TREASURE_GROUPS[is_jp]
+    # download the stage and name files at the same time
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        stages_future = executor.submit(get_stages, is_jp)
+        names_future = executor.submit(get_names, is_jp)
+        treasure_stages = stages_future.result()
+        treasure_names = names_future.result()
     if treasure_stages is None or treasure_names is None:
         return None
-    return {"names": treasure_names, "stages": treasure_stages}
+    TREASURE_GROUPS[is_jp] = {"names": treasure_names, "stages": treasure_stages}
+    return TREASURE_GROUPS[is_jp]
 
 
 def set_treasures(
@@ -125,12 +118,10 @@ def set_treasures(
 ) -> list[list[int]]:
     """Set the treasure stats of a set of levels"""
 
-    for i, level in enumerate(user_levels):
+    for chapter_id, level in zip(main_story.STORY_CHAPTER_IDS, user_levels):
         if level == -1:
             continue
-        if i > 2:
-            i += 1
-        treasure_stats[i] = [level] * 48 + [0]
+        treasure_stats[chapter_id] = [level] * 48 + [0]
     return treasure_stats
 
 
@@ -139,14 +130,11 @@ def set_specific_treasures(
 ) -> list[list[int]]:
     """Set the treasure stats of specific treasures"""
 
-    for i, stage in enumerate(treasure_data):
+    chapter_treasures = treasure_stats[chapter_id]
+    for stage_id, stage in zip(TREASURE_STAGE_IDS, treasure_data):
         if stage == -1:
             continue
-        if i > 45:
-            stage_id = i
-        else:
-            stage_id = 45 - i
-        treasure_stats[chapter_id][stage_id] = stage
+        chapter_treasures[stage_id] = stage
     return treasure_stats
 
 
@@ -159,11 +147,13 @@ def set_treasure_groups(
 ) -> list[list[int]]:
     """Set the treasure stats of a group of treasures"""
 
+    chapter_treasures = treasures_stats[chapter_id]
+    group_stages = treasure_grps["stages"][type_id]
     for i, treasure_level in enumerate(treasure_levels):
-        stages = treasure_grps["stages"][type_id][i]
-        for stage in stages:
-            if treasure_level is not None:
-                treasures_stats[chapter_id][stage] = treasure_level
+        if treasure_level is None:
+            continue
+        for stage in group_stages[i]:
+            chapter_treasures[stage] = treasure_level
     return treasures_stats
 
 
@@ -180,10 +170,8 @@ def treasure_groups(save_stats: dict[str, Any]) -> dict[str, Any]:
     for chapter_id in ids:
         helper.colored_text(f"Chapter: &{main_story.CHAPTERS[chapter_id]}&")
         type_id = chapter_id // 3
-        if chapter_id > 2:
-            chapter_id += 1
+        chapter_id = main_story.format_story_id(chapter_id)
         names = treasure_grps["names"][type_id]
-        treasure_levels = [-1] * len(names)
         helper.colored_text("&0& = None, &1& = Inferior, &2& = Normal, &3& = Superior")
         treasure_levels = item.IntItemGroup.from_lists(
             names=names,
@@ -212,6 +200,7 @@ def specific_stages(save_stats: dict[str, Any]):
     chapter_ids = story_level_id_selector.select_specific_chapters()
 
     choice = story_level_id_selector.get_option()
+    stage_names = list(range(1, 49))
     for chapter_id in chapter_ids:
         chapter_id = main_story.format_story_id(chapter_id)
         stage_ids = story_level_id_selector.select_levels(chapter_id, choice)
@@ -220,7 +209,7 @@ def specific_stages(save_stats: dict[str, Any]):
             stage_ids,
             False,
             treasure_data,
-            list(range(1, 49)),
+            stage_names,
             "treasure level",
             "stage",
             "(&0&=none, &1&=inferior, &2&=normal, &3&=superior)",
@@ -7,15 +7,28 @@ from ... import helper, item
 def set_trade_progress_val(storage: dict[str, Any]) -> tuple[dict[str, Any], bool]:
     """Handler for editting trade progress to allow for unbannable rare tickets"""
 
-    space = False
-    for i in range(len(storage["types"])):
-        storage_item = storage["types"][i]
-        if storage_item == 0 or (storage["ids"][i] == 1 and storage_item == 2):
-            storage["ids"][i] = 1
-            storage["types"][i] = 2
-            space = True
+    types: list[int] = storage["types"]
+    ids: list[int] = storage["ids"]
+    # use the first empty slot, or one before it that already holds a rare ticket
+    try:
+        slot = types.index(0)
+    except ValueError:
+        slot = len(types)
+    start = 0
+    while True:
+        try:
+            start = types.index(2, start, slot)
+        except ValueError:
             break
-    return storage, space
+        if ids[start] == 1:
+            slot = start
+            break
+        start += 1
+    if slot == len(types):
+        return storage, False
+    ids[slot] = 1
+    types[slot] = 2
+    return storage, True
 
 
 def set_trade_progress(save_stats: dict[str, Any]) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 """Get game data from the BCData GitHub repository."""
 import os
+import threading
 from typing import Optional
 import requests
 
@@ -7,6 +8,9 @@ from . import helper
 
 URL = "https://raw.githubusercontent.com/fieryhenry/BCData/master/"
 
+latest_versions: Optional[list[str]] = None
+latest_versions_lock = threading.Lock()
+
 
 def download_file(
     game_version: str,
@@ -52,17 +56,26 @@ def download_file(
 
 def get_latest_versions() -> Optional[list[str]]:
     """
-    Gets the latest versions of the game data.
+    Gets the latest versions of the game data. Only fetched once per session.
 
     Returns:
         Optional[list[str]]: The latest versions of the game data.
     """
-    try:
-        response = requests.get(URL + "latest.txt")
-    except requests.exceptions.ConnectionError:
-        return None
-    versions = response.text.splitlines()
-    return versions
+    global latest_versions
+    with latest_versions_lock:
+        if latest_versions is not None:
+            return latest_versions
+        try:
+            response = requests.get(URL + "latest.txt")
+        except requests.exceptions.ConnectionError:
+            return None
+        if not response.ok:
+            return None
+        versions = response.text.splitlines()
+        if len(versions) < 2:
+            return None
+        latest_versions = versions
+        return latest_versions
 
 
 def get_latest_version(is_jp: bool) -> Optional[str]:
@@ -1,11 +1,13 @@
 """Helper script for usefull functions"""
 
 import filecmp
+import functools
 import json
-from multiprocessing import Process
 import os
+import re
 import shutil
 import sys
+import threading
 import time
 from typing import Any, Callable, Generator, Optional, Union
 import colored  # type: ignore
@@ -74,26 +76,19 @@ def delete_dir(path: str) -> None:
 def create_dirs(path: str) -> None:
     """Create directories if they don't exist"""
 
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 
 def offset_list(lst: list[int], offset: int) -> list[int]:
     """Offset each value in an list by a certain amount"""
 
-    new_list: list[int] = []
-    for item in lst:
-        new_list.append(item + offset)
-    return new_list
+    return [item + offset for item in lst]
 
 
 def copy_first_n(lst: list[Any], number: int) -> list[Any]:
     """Get the nth item in a list of lists"""
 
-    new_list: list[Any] = []
-    for item in lst:
-        new_list.append(item[number])
-    return new_list
+    return [item[number] for item in lst]
 
 
 def get_file(file_name: str) -> str:
@@ -232,10 +227,7 @@ def check_int_max(value: str, max_value: Optional[int] = None) -> Optional[int]:
 def int_to_str_ls(int_list: list[int]) -> list[str]:
     """Turn list of ints to list of strings"""
 
-    str_list: list[str] = []
-    for i in int_list:
-        str_list.append(str(i))
-    return str_list
+    return list(map(str, int_list))
 
 
 def parse_int_list(lst: list[str], offset: int) -> list[int]:
@@ -253,7 +245,11 @@ def parse_int_list(lst: list[str], offset: int) -> list[int]:
 def clamp(value: int, min_value: int, max_value: int) -> int:
     """Clamp a value between two values"""
 
-    return max(min(value, max_value), min_value)
+    if value > max_value:
+        value = max_value
+    if value < min_value:
+        value = min_value
+    return value
 
 
 def write_file_bytes(file_path: str, data: bytes) -> bytes:
@@ -350,6 +346,12 @@ def parse_int_list_list(list_of_lists: list[list[str]]) -> list[list[Any]]:
     new_lists: list[list[Any]] = []
 
     for lst in list_of_lists:
+        try:
+            new_lists.append(list(map(int, lst)))
+            continue
+        except ValueError:
+            pass
+        # keep the items that aren't numbers as strings
         new_list: list[Any] = []
         for item in lst:
             try:
@@ -539,6 +541,13 @@ def is_android() -> bool:
     return "ANDROID_ROOT" in os.environ
 
 
+@functools.lru_cache(maxsize=64)
+def get_color_codes(base: str, new: str) -> tuple[str, str, str]:
+    """Get the escape codes used by colored_text, cached as resolving a hex color is slow"""
+
+    return colored.fg(new), colored.fg(base), colored.fg(WHITE)  # type: ignore
+
+
 def colored_text(
     text: str,
     base: str = WHITE,
@@ -547,40 +556,60 @@ def colored_text(
     end: str = "\n",
 ):
     """Print text with colors"""
-    color_new = colored.fg(new)  # type: ignore
-    color_base = colored.fg(base)  # type: ignore
-    color_reset = colored.fg(WHITE)  # type: ignore
+
+    print(render_colored_text(text, base, new, split_char), end=end)
+
+
+def render_colored_text(
+    text: str,
+    base: str = WHITE,
+    new: str = DARK_YELLOW,
+    split_char: str = "&",
+) -> str:
+    """Get text with the color escape codes applied, without printing it"""
+
+    color_new, color_base, color_reset = get_color_codes(base, new)
 
     text_split: list[str] = split_text(text, split_char)
+    output: list[str] = []
     for i, text_section in enumerate(text_split):
         if i % 2:
-            print(f"{color_new}{text_section}{color_base}", end="")
+            output.append(f"{color_new}{text_section}{color_base}")
         else:
-            print(f"{color_base}{text_section}{color_base}", end="")
-    print(color_reset, end=end)
+            output.append(f"{color_base}{text_section}{color_base}")
+    output.append(color_reset)
+    return "".join(output)
+
+
+def get_split_text_pattern(split_char: str) -> "re.Pattern[str]":
+    """Get the pattern used to tokenize text on split_char, allowing for escaped split chars"""
+
+    char = re.escape(split_char)
+    return re.compile(rf"\\({char})|({char})|([^{char}\\]+|\\)")
+
+
+SPLIT_TEXT_PATTERN = get_split_text_pattern("&")
 
 
 def split_text(text: str, split_char: str = "&") -> list[str]:
     """Split text on split_char, allowing for escaped split chars"""
 
+    if split_char not in text and "\\" not in text:
+        return [text]
+    if split_char == "&":
+        pattern = SPLIT_TEXT_PATTERN
+    else:
+        pattern = get_split_text_pattern(split_char)
+
     text_split: list[str] = []
-    current_string = ""
-    skip = 0
-    for i, char in enumerate(text):
-        if skip > 0:
-            skip -= 1
-            continue
-        if char == "\\":
-            if text[i + 1] == split_char:
-                current_string += split_char
-                skip = 1
-                continue
-        if char == split_char:
-            text_split.append(current_string)
-            current_string = ""
+    current_string: list[str] = []
+    for escaped, split, text_section in pattern.findall(text):
+        if split:
+            text_split.append("".join(current_string))
+            current_string = []
         else:
-            current_string += char
-    text_split.append(current_string)
+            current_string.append(escaped or text_section)
+    text_split.append("".join(current_string))
     return text_split
 
 
@@ -592,38 +621,42 @@ def colored_list(
 ):
     """Print a list with colors and extra data if provided"""
 
-    final = ""
+    lines: list[str] = []
     for i, item in enumerate(items):
+        line = f"&{item}&"
         if index:
-            final += f"{i+1}. "
-        final += f"&{item}&"
+            line = f"{i+1}. {line}"
         if extra_data:
             if extra_data[i] is not None:
                 if isinstance(offset, int) and isinstance(extra_data[i], int):
-                    final += f" &:& {extra_data[i]+offset}"
+                    line += f" &:& {extra_data[i]+offset}"
                 else:
-                    final += f" &:& {extra_data[i]}"
-        final += "\n"
-    final = final.rstrip("\n")
+                    line += f" &:& {extra_data[i]}"
+        lines.append(line)
+    final = "\n".join(lines).rstrip("\n")
     colored_text(final)
 
 
 def calculate_user_rank(save_stats: dict[str, Any]):
     """Calculate the user rank"""
 
-    user_rank = 0
-    for cat_id, cat_flag in enumerate(save_stats["cats"]):
-        if cat_flag == 0:
-            continue
-
-        user_rank += save_stats["cat_upgrades"]["Base"][cat_id] + 1
-        user_rank += save_stats["cat_upgrades"]["Plus"][cat_id]
+    cat_upgrades = save_stats["cat_upgrades"]
+    user_rank = sum(
+        base + plus + 1
+        for cat_flag, base, plus in zip(
+            save_stats["cats"], cat_upgrades["Base"], cat_upgrades["Plus"]
+        )
+        if cat_flag != 0
+    )
 
-    for skill_id in range(len(save_stats["blue_upgrades"]["Base"])):
-        if skill_id == 1:
-            continue
-        user_rank += save_stats["blue_upgrades"]["Base"][skill_id] + 1
-        user_rank += save_stats["blue_upgrades"]["Plus"][skill_id]
+    blue_upgrades = save_stats["blue_upgrades"]
+    user_rank += sum(
+        base + plus + 1
+        for skill_id, (base, plus) in enumerate(
+            zip(blue_upgrades["Base"], blue_upgrades["Plus"])
+        )
+        if skill_id != 1
+    )
 
     return user_rank
 
@@ -693,21 +726,6 @@ def setup_tk() -> Any:
     return root
 
 
-def run_in_parallel(fns: list[Process]) -> None:
-    """
-    Run a list of functions in parallel
-
-    Args:
-        fns (list[Process]): List of functions to run in parallel
-    """
-    proc: list[Process] = []
-    for fn in fns:
-        fn.start()
-        proc.append(fn)
-    for p in proc:
-        p.join()
-
-
 def run_in_background(func: Callable[..., Any]) -> None:
     """
     Run a function in the background
@@ -715,7 +733,7 @@ def run_in_background(func: Callable[..., Any]) -> None:
     Args:
         fn (Callable[..., Any]): Function to run in the background
     """
-    Process(target=func).start()
+    threading.Thread(target=func).start()
 
 
 def get_cc(save_stats: dict[str, Any]) -> str:
@@ -10,6 +10,8 @@ from . import (
 
 
 class Bannable:
+    __slots__ = ("type", "inquiry_code", "work_around")
+
     def __init__(
         self,
         type: "managed_item.ManagedItemType",
@@ -22,6 +24,8 @@ class Bannable:
 
 
 class Int:
+    __slots__ = ("value", "byte_size", "signed")
+
     def __init__(self, value: Optional[int], byte_size: int = 4, signed: bool = True):
         self.value = value
         self.byte_size = byte_size
@@ -190,10 +194,7 @@ class IntItemGroup:
         items: list[IntItem] = []
         for i in range(len(names)):
             max_value = maxes[i] if isinstance(maxes, list) else maxes
-            try:
-                value = values[i] if values is not None else None
-            except IndexError:
-                value = None
+            value = values[i] if values is not None and i < len(values) else None
             items.append(
                 IntItem(
                     names[i],
@@ -1,6 +1,8 @@
 from . import config_manager, helper
 import os
 
+LOCAL_MANAGERS: dict[str, "LocalManager"] = {}
+
 
 class PropertySet:
     def __init__(self, locale: str, property: str):
@@ -46,6 +48,7 @@ class LocalManager:
             if not os.path.exists(self.en_path):
                 os.makedirs(self.en_path)
             self.en_properties: dict[str, PropertySet] = {}
+        self.keys: dict[str, str] = {}
         self.parse()
 
     def parse(self):
@@ -62,19 +65,21 @@ class LocalManager:
                     self.en_properties[file_name[:-11]] = PropertySet(
                         "en", file_name[:-11]
                     )
+        self.index_keys()
+
+    def index_keys(self):
+        property_sets = list(self.properties.values())
+        if not self.is_en:
+            property_sets.extend(self.en_properties.values())
+        for prop in property_sets:
+            for key in prop.properties:
+                self.keys[key] = prop.get_key(key)
 
     def get_key(self, property: str, key: str) -> str:
         return self.properties[property].get_key(key)
 
     def search_key(self, key: str) -> str:
-        value = None
-        for prop in self.properties.values():
-            if key in prop.properties:
-                value = prop.get_key(key)
-        if not self.is_en:
-            for prop in self.en_properties.values():
-                if key in prop.properties:
-                    value = prop.get_key(key)
+        value = self.keys.get(key)
         if value is None:
             raise KeyError(f"Key {key} not found")
 
@@ -92,7 +97,16 @@ class LocalManager:
 
     @staticmethod
     def from_config() -> "LocalManager":
-        return LocalManager(config_manager.get_config_value("LOCALE"))
+        return LocalManager.get_instance(config_manager.get_config_value("LOCALE"))
+
+    @staticmethod
+    def get_instance(locale: str) -> "LocalManager":
+        """Get a shared manager for a locale so the property files are only parsed once"""
+        manager = LOCAL_MANAGERS.get(locale)
+        if manager is None:
+            manager = LocalManager(locale)
+            LOCAL_MANAGERS[locale] = manager
+        return manager
 
     @staticmethod
     def get_locales() -> list[str]:
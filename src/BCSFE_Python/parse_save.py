@@ -3,6 +3,7 @@
 import collections
 import datetime
 import enum
+import functools
 import json
 import struct
 import traceback
@@ -15,22 +16,45 @@ from . import updater
 address = 0
 save_data_g = None
 
+INT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+# 10 chapter progress values then 51 clear counts for each of the 10 chapters
+MAIN_STORY_STRUCT = struct.Struct(f"<{10 + 10 * 51}I")
+# 49 treasure levels for each of the 10 chapters
+TREASURES_STRUCT = struct.Struct(f"<{10 * 49}I")
+# cat id and form for each of the 10 cats in a cleared stage line up
+CLEARED_SLOT_CATS_STRUCT = struct.Struct("<" + "HB" * 10)
+# year, month, day, each followed by a duplicate
+TIME_DATA_DATE_STRUCT = struct.Struct("<6I")
+# hour, minute, second
+TIME_DATA_CLOCK_STRUCT = struct.Struct("<3I")
+# year, month, day, hour, minute, second
+TIME_DATA_STRUCT = struct.Struct("<6I")
+
 
 def re_order(data: dict[str, Any]) -> collections.OrderedDict[str, Any]:
     """Move all unknown vals to the bottom of the json"""
 
-    priority: list[str] = json.loads(
-        helper.read_file_string(helper.get_file("order.json"))
-    )
-    ordered_data = collections.OrderedDict(data)
+    priority = get_json_order()
+    ordered_data = collections.OrderedDict((key, data[key]) for key in priority)
+    unknown_keys: list[str] = []
+    for key in data:
+        if key in ordered_data:
+            continue
+        if "unknown" in key:
+            unknown_keys.append(key)
+        else:
+            ordered_data[key] = data[key]
+    for key in unknown_keys:
+        ordered_data[key] = data[key]
+    return ordered_data
 
-    for item in ordered_data.copy():
-        if "unknown" in item:
-            ordered_data.move_to_end(item)
 
-    for i in range(len(priority)):
-        ordered_data.move_to_end(priority[len(priority) - 1 - i], False)
-    return ordered_data
+@functools.lru_cache(maxsize=1)
+def get_json_order() -> tuple[str, ...]:
+    """Get the keys that should be at the top of the json, in order"""
+
+    return tuple(json.loads(helper.read_file_string(helper.get_file("order.json"))))
 
 
 def set_address(val: int):
@@ -83,20 +107,11 @@ def convert_little(byte_data: bytes) -> int:
 
 
 def get_time_data_skip(dst_flag: bool) -> dict[str, Any]:
-    year = next_int(4)
-    year_2 = next_int(4)
-
-    month = next_int(4)
-    month_2 = next_int(4)
-
-    day = next_int(4)
-    day_2 = next_int(4)
+    year, year_2, month, month_2, day, day_2 = get_struct_data(TIME_DATA_DATE_STRUCT)
 
     time_stamp = get_double()
 
-    hour = next_int(4)
-    minute = next_int(4)
-    second = next_int(4)
+    hour, minute, second = get_struct_data(TIME_DATA_CLOCK_STRUCT)
     dst = 0
     if dst_flag:
         dst = next_int(1)
@@ -113,12 +128,7 @@ def get_time_data_skip(dst_flag: bool) -> dict[str, Any]:
 def get_time_data(dst_flag: bool) -> str:
     if dst_flag:
         _ = next_int(1)
-    year = next_int(4)
-    month = next_int(4)
-    day = next_int(4)
-    hour = next_int(4)
-    minute = next_int(4)
-    second = next_int(4)
+    year, month, day, hour, minute, second = get_struct_data(TIME_DATA_STRUCT)
 
     time = datetime.datetime(year, month, day, hour, minute, second)
     return time.isoformat()
@@ -134,6 +144,12 @@ def get_length_data(
         raise Exception("Invalid save data")
     if length > len(save_data_g):
         raise Exception("Length too large")
+    int_format = INT_FORMATS.get(separator)
+    end_address = address + length * separator
+    if int_format is not None and end_address <= len(save_data_g):
+        data = list(struct.unpack_from(f"<{length}{int_format}", save_data_g, address))
+        set_address(end_address)
+        return data
     for _ in range(length):
         data.append(next_int(separator))
     return data
@@ -149,6 +165,11 @@ def get_length_doubles(
         raise Exception("Invalid save data")
     if length > len(save_data_g):
         raise Exception("Length too large")
+    end_address = address + length * 8
+    if end_address <= len(save_data_g):
+        data = list(struct.unpack_from(f"<{length}d", save_data_g, address))
+        set_address(end_address)
+        return data
     for _ in range(length):
         data.append(get_double())
     return data
@@ -167,31 +188,46 @@ def get_equip_slots() -> list[list[int]]:
     return data
 
 
+def get_struct_data(data_struct: struct.Struct) -> tuple[Any, ...]:
+    """Read a fixed layout block of unsigned ints with a precompiled struct"""
+
+    if save_data_g is None:
+        raise Exception("Invalid save data")
+    end_address = address + data_struct.size
+    if end_address <= len(save_data_g):
+        data = data_struct.unpack_from(save_data_g, address)
+    else:
+        # pad the missing bytes with 0 like next_int does at the end of the buffer
+        block = save_data_g[address:end_address].ljust(data_struct.size, b"\x00")
+        data = data_struct.unpack(block)
+    set_address(end_address)
+    return data
+
+
+def get_struct_dict(length: int, key_format: str, value_format: str) -> dict[int, int]:
+    """Read length interleaved key/value pairs with a single struct unpack"""
+
+    if key_format == value_format:
+        data_struct = struct.Struct(f"<{length * 2}{key_format}")
+    else:
+        data_struct = struct.Struct("<" + (key_format + value_format) * length)
+    data = get_struct_data(data_struct)
+    return dict(zip(data[0::2], data[1::2]))
+
+
 def get_main_story_levels() -> dict[str, Any]:
-    chapter_progress: list[int] = []
-    for _ in range(10):
-        chapter_progress.append(next_int(4))
-    times_cleared: list[list[int]] = []
-    for _ in range(10):
-        chapter_times: list[int] = []
-        for _ in range(51):
-            chapter_times.append(next_int(4))
-        times_cleared.append(chapter_times)
-    times_cleared_dict = times_cleared
+    data = get_struct_data(MAIN_STORY_STRUCT)
+    chapter_progress = list(data[:10])
+    times_cleared = [list(data[i : i + 51]) for i in range(10, len(data), 51)]
     return {
         "Chapter Progress": chapter_progress,
-        "Times Cleared": times_cleared_dict,
+        "Times Cleared": times_cleared,
     }
 
 
 def get_treasures() -> list[list[int]]:
-    treasures: list[list[int]] = []
-    for _ in range(10):
-        chapter: list[int] = []
-        for _ in range(49):
-            chapter.append(next_int(4))
-        treasures.append(chapter)
-    return treasures
+    data = get_struct_data(TREASURES_STRUCT)
+    return [list(data[i : i + 49]) for i in range(0, len(data), 49)]
 
 
 def get_cat_upgrades() -> dict[str, Any]:
@@ -433,12 +469,7 @@ def get_outbreaks() -> dict[int, Any]:
     for _ in range(chapters_count):
         chapter_id = next_int(4)
         stages_count = next_int(4)
-        chapter = {}
-        for _ in range(stages_count):
-            stage_id = next_int(4)
-            outbreak_cleared_flag = next_int(1)
-            chapter[stage_id] = outbreak_cleared_flag
-        outbreaks[chapter_id] = chapter
+        outbreaks[chapter_id] = get_struct_dict(stages_count, "I", "B")
     return outbreaks
 
 
@@ -589,10 +620,7 @@ def get_ht_it_data() -> dict[str, Any]:
     current_data: dict[str, Any] = {}
     current_data = {"total": total, "stars": stars, "selected": []}
 
-    for _ in range(total):
-        for _ in range(stars):
-            current_data["selected"].append(next_int(4))
-
+    current_data["selected"] = get_length_data(4, 4, total * stars)
     current_data["selected"] = list(helper.chunks(current_data["selected"], 4))
 
     total = next_int(4)
@@ -607,10 +635,7 @@ def get_ht_it_data() -> dict[str, Any]:
         "unlock_next": [],
     }
 
-    for _ in range(total):
-        for _ in range(stars):
-            progress_data["clear_progress"].append(next_int(4))
-
+    progress_data["clear_progress"] = get_length_data(4, 4, total * stars)
     progress_data["clear_progress"] = list(
         helper.chunks(progress_data["clear_progress"], 4)
     )
@@ -649,13 +674,7 @@ def get_ht_it_data() -> dict[str, Any]:
 
 
 def get_mission_segment() -> dict[int, int]:
-    missions: dict[int, int] = {}
-    length = next_int(4)
-    for _ in range(length):
-        mission_id = next_int(4)
-        mission_value = next_int(4)
-        missions[mission_id] = mission_value
-    return missions
+    return get_dict(int, int)
 
 
 def get_mission_data() -> dict[str, Any]:
@@ -864,14 +883,7 @@ def get_gold_pass_data() -> dict[str, Any]:
     data["flag_2"] = next_int_len(4)
     data["expiry_date_3"] = get_double()
 
-    number_of_rewards = next_int(4)
-    claimed_rewards: dict[int, int] = {}
-    for _ in range(number_of_rewards):
-        item_id = next_int(4)
-        amount = next_int(4)
-        claimed_rewards[item_id] = amount
-
-    data["claimed_rewards"] = claimed_rewards
+    data["claimed_rewards"] = get_dict(int, int)
     data["unknown_4"] = next_int_len(8)
     data["unknown_5"] = next_int_len(1)
     data["unknown_6"] = next_int_len(1)
@@ -888,12 +900,9 @@ def get_talent_data() -> dict[int, list[dict[str, int]]]:
         cat_data: list[dict[str, int]] = []
 
         number_of_talents = next_int(4)
-
-        for _ in range(number_of_talents):
-            talent_id = next_int(4)
-            talent_level = next_int(4)
-            talent = {"id": talent_id, "level": talent_level}
-            cat_data.append(talent)
+        talent_data = get_struct_data(struct.Struct(f"<{number_of_talents * 2}I"))
+        for talent_id, talent_level in zip(talent_data[0::2], talent_data[1::2]):
+            cat_data.append({"id": talent_id, "level": talent_level})
         talents[cat_id] = cat_data
     return talents
 
@@ -902,12 +911,7 @@ def get_medals() -> dict[str, Any]:
     medal_data_1 = get_length_data(2, 2)
 
     total_medals = next_int(2)
-    medals = {}
-
-    for _ in range(total_medals):
-        medal_id = next_int(2)
-        medal_flag = next_int(1)
-        medals[medal_id] = medal_flag
+    medals = get_struct_dict(total_medals, "H", "B")
     return {"medal_data_1": medal_data_1, "medal_data_2": medals}
 
 
@@ -1140,8 +1144,14 @@ def get_gauntlet_progress(
 
 
 class ClearedSlots:
+    __slots__ = ("slots", "slot_stages", "end_index")
+
     class Slot:
+        __slots__ = ("cats", "slot_index", "separator")
+
         class Cat:
+            __slots__ = ("cat_id", "cat_form")
+
             def __init__(self, cat_id: int, cat_form: int):
                 self.cat_id = cat_id
                 self.cat_form = cat_form
@@ -1152,10 +1162,6 @@ class ClearedSlots:
                     "cat_form": self.cat_form,
                 }
 
-            @staticmethod
-            def from_dict(data: dict[str, Any]) -> "ClearedSlots.Slot.Cat":
-                return ClearedSlots.Slot.Cat(data["cat_id"], data["cat_form"])
-
         def __init__(self, cats: list[Cat], slot_index: int, separator: int):
             self.cats = cats
             self.slot_index = slot_index
@@ -1168,16 +1174,12 @@ class ClearedSlots:
                 "separator": self.separator,
             }
 
-        @staticmethod
-        def from_dict(data: dict[str, Any]):
-            return ClearedSlots.Slot(
-                [ClearedSlots.Slot.Cat.from_dict(cat) for cat in data["cats"]],
-                data["slot_index"],
-                data["separator"],
-            )
-
     class StageSlot:
+        __slots__ = ("slot_index", "stages")
+
         class Stage:
+            __slots__ = ("stage_id",)
+
             def __init__(self, stage_id: int):
                 self.stage_id = stage_id
 
@@ -1186,10 +1188,6 @@ class ClearedSlots:
                     "stage_id": self.stage_id,
                 }
 
-            @staticmethod
-            def from_dict(data: dict[str, Any]) -> "ClearedSlots.StageSlot.Stage":
-                return ClearedSlots.StageSlot.Stage(data["stage_id"])
-
         def __init__(self, slot_index: int, stages: list[Stage]):
             self.slot_index = slot_index
             self.stages = stages
@@ -1200,16 +1198,6 @@ class ClearedSlots:
                 "stages": [stage.to_dict() for stage in self.stages],
             }
 
-        @staticmethod
-        def from_dict(data: dict[str, Any]) -> "ClearedSlots.StageSlot":
-            return ClearedSlots.StageSlot(
-                data["slot_index"],
-                [
-                    ClearedSlots.StageSlot.Stage.from_dict(stage)
-                    for stage in data["stages"]
-                ],
-            )
-
     def __init__(self, slots: list[Slot], slot_stages: list[StageSlot], end_index: int):
         self.slots = slots
         self.slot_stages = slot_stages
@@ -1222,14 +1210,6 @@ class ClearedSlots:
             "end_index": self.end_index,
         }
 
-    @staticmethod
-    def from_dict(data: dict[str, Any]) -> "ClearedSlots":
-        return ClearedSlots(
-            [ClearedSlots.Slot.from_dict(slot) for slot in data["slots"]],
-            [ClearedSlots.StageSlot.from_dict(stage) for stage in data["slot_stages"]],
-            data["end_index"],
-        )
-
 
 def get_enigma_stages() -> dict[str, Any]:
     """
@@ -1272,12 +1252,8 @@ def get_cleared_slots() -> tuple[dict[str, Any], list[dict[str, int]]]:
     slots: list[ClearedSlots.Slot] = []
 
     for _ in range(total_slots):
-        cats: list[ClearedSlots.Slot.Cat] = []
-        for _ in range(10):
-            cat_id = next_int(2)
-            cat_form = next_int(1)
-            cat_data = ClearedSlots.Slot.Cat(cat_id, cat_form)
-            cats.append(cat_data)
+        cat_data = get_struct_data(CLEARED_SLOT_CATS_STRUCT)
+        cats = list(map(ClearedSlots.Slot.Cat, cat_data[0::2], cat_data[1::2]))
         separator = next_int(3)
         slot = ClearedSlots.Slot(cats, index, separator)
         index = next_int(2)
@@ -1618,8 +1594,7 @@ def get_double() -> float:
 
     if save_data_g is None:
         raise Exception("No save data loaded")
-    data = save_data_g[address : address + 8]
-    val = struct.unpack("d", data)[0]
+    val = struct.unpack_from("d", save_data_g, address)[0]
     set_address(address + 8)
     return val
 
@@ -1714,6 +1689,8 @@ def get_dict(
 ) -> dict[Any, Any]:
     if length is None:
         length = next_int(4)
+    if key_type == int and value_type == int:
+        return get_struct_dict(length, "I", "I")
     data: dict[Any, Any] = {}
     for _ in range(length):
         if key_type == int:
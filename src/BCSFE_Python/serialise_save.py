@@ -1,5 +1,6 @@
 """Handler for serialising save data from dict"""
 
+import itertools
 import struct
 from typing import Any, Union
 
@@ -31,6 +32,13 @@ def write(
 def create_list_separated(data: list[int], length: int) -> list[int]:
     """Creates a list of bytes from a list of numbers"""
 
+    int_format = parse_save.INT_FORMATS.get(length)
+    if int_format is not None:
+        try:
+            return list(struct.pack(f"<{len(data)}{int_format}", *data))
+        except struct.error:
+            # fall through so out of range values raise the same error as before
+            pass
     lst: list[int] = []
     for item in data:
         byte_data = list(helper.num_to_bytes(item, length))
@@ -158,17 +166,18 @@ def serialise_equip_slots(
 def serialise_main_story(
     save_data: list[int], story_chapters: dict[str, list[Any]]
 ) -> list[int]:
-    save_data = write_length_data(
-        save_data, story_chapters["Chapter Progress"], write_length=False
-    )
+    data: list[int] = list(story_chapters["Chapter Progress"])
     for chapter in story_chapters["Times Cleared"]:
-        save_data = write_length_data(save_data, chapter, write_length=False)
+        data.extend(chapter)
+    save_data = write_length_data(save_data, data, write_length=False)
     return save_data
 
 
 def serialise_treasures(save_data: list[int], treasures: list[list[int]]) -> list[int]:
+    data: list[int] = []
     for chapter in treasures:
-        save_data = write_length_data(save_data, chapter, write_length=False)
+        data.extend(chapter)
+    save_data = write_length_data(save_data, data, write_length=False)
     return save_data
 
 
@@ -258,14 +267,16 @@ def serialise_event_stages(
     for chapter in event_stages["Value"]["clear_progress"]:
         save_data = write_length_data(save_data, chapter, 1, 1, False)
 
-    clear_amount = [0] * total * stars * stages
+    chapter_size = stages * stars
+    clear_amount = [0] * total * chapter_size
     clear_amount_data = event_stages["Value"]["clear_amount"]
     for i in range(total):
-        for j in range(stages):
-            for k in range(stars):
-                clear_amount[i * stages * stars + j * stars + k] = clear_amount_data[i][
-                    k
-                ][j]
+        chapter_clears = clear_amount_data[i]
+        offset = i * chapter_size
+        # the stages of each star are interleaved in the save data
+        for k in range(stars):
+            star_clears = chapter_clears[k][:stages]
+            clear_amount[offset + k : offset + chapter_size : stars] = star_clears
 
     save_data = write_length_data(save_data, clear_amount, 4, 2, False)
 
@@ -392,9 +403,11 @@ def serialise_talent_data(save_data: list[int], talents: dict[str, Any]) -> list
         cat_talent_data = talents[cat_id]
         save_data = write(save_data, int(cat_id), 4)
         save_data = write(save_data, len(cat_talent_data), 4)
+        talent_data: list[int] = []
         for talent in cat_talent_data:
-            save_data = write(save_data, talent["id"], 4)
-            save_data = write(save_data, talent["level"], 4)
+            talent_data.append(int(talent["id"]))
+            talent_data.append(int(talent["level"]))
+        save_data = write_length_data(save_data, talent_data, write_length=False)
     return save_data
 
 
@@ -584,10 +597,9 @@ def serialise_play_time(save_data: list[int], play_time: dict[str, Any]) -> list
 
 
 def serialise_mission_segment(save_data: list[int], data: dict[int, Any]) -> list[int]:
+    pairs = list(map(int, itertools.chain.from_iterable(data.items())))
     save_data = write(save_data, len(data), 4)
-    for mission in data:
-        save_data = write(save_data, mission, 4)
-        save_data = write(save_data, data[mission], 4)
+    save_data = write_length_data(save_data, pairs, write_length=False)
     return save_data
 
 
@@ -710,21 +722,20 @@ def serialise_cleared_slots(
     Returns:
         list[int]: The save data
     """
-    cleared_slot_data = parse_save.ClearedSlots.from_dict(cleared_slots)
-    save_data = write(save_data, len(cleared_slot_data.slots), 2)
-    for slot in cleared_slot_data.slots:
-        save_data = write(save_data, slot.slot_index, 2)
-        for cat in slot.cats:
-            save_data = write(save_data, cat.cat_id, 2)
-            save_data = write(save_data, cat.cat_form, 1)
-        save_data = write(save_data, slot.separator, 3)
-    save_data = write(save_data, cleared_slot_data.end_index, 2)
-
-    for stages_slot in cleared_slot_data.slot_stages:
-        save_data = write(save_data, stages_slot.slot_index, 2)
-        save_data = write(save_data, len(stages_slot.stages), 2)
-        for stage in stages_slot.stages:
-            save_data = write(save_data, stage.stage_id, 4)
+    save_data = write(save_data, len(cleared_slots["slots"]), 2)
+    for slot in cleared_slots["slots"]:
+        save_data = write(save_data, slot["slot_index"], 2)
+        for cat in slot["cats"]:
+            save_data = write(save_data, cat["cat_id"], 2)
+            save_data = write(save_data, cat["cat_form"], 1)
+        save_data = write(save_data, slot["separator"], 3)
+    save_data = write(save_data, cleared_slots["end_index"], 2)
+
+    for stages_slot in cleared_slots["slot_stages"]:
+        save_data = write(save_data, stages_slot["slot_index"], 2)
+        save_data = write(save_data, len(stages_slot["stages"]), 2)
+        for stage in stages_slot["stages"]:
+            save_data = write(save_data, stage["stage_id"], 4)
     return save_data
 
 
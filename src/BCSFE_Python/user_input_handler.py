@@ -229,6 +229,8 @@ def get_int(dialog: str, default: Optional[int] = None) -> int:
 
     helper.colored_text(dialog, end="")
     locale_manager = locale_handler.LocalManager.from_config()
+    # only rendered once the first invalid input is entered
+    error_text: Optional[str] = None
     while True:
         try:
             val = input()
@@ -237,7 +239,11 @@ def get_int(dialog: str, default: Optional[int] = None) -> int:
         except ValueError:
             if default is not None:
                 return default
-            helper.colored_text(locale_manager.search_key("invalid_int"), helper.RED)
+            if error_text is None:
+                error_text = helper.render_colored_text(
+                    locale_manager.search_key("invalid_int"), helper.RED
+                )
+            print(error_text)
 
 
 def ask_if_individual(item_name: str) -> bool:
@@ -255,11 +261,19 @@ def ask_if_individual(item_name: str) -> bool:
 def get_yes_no(dialog: str) -> bool:
     """Get user input as a yes or no"""
     locale_manager = locale_handler.LocalManager.from_config()
+    prompt_text = helper.render_colored_text(dialog)
+    # only rendered once the first invalid input is entered
+    error_text: Optional[str] = None
     while True:
-        val = colored_input(dialog)
+        print(prompt_text, end="")
+        val = input()
         if val:
             if val.lower()[0] == "y":
                 return True
             if val.lower()[0] == "n":
                 return False
-        helper.colored_text(locale_manager.search_key("invalid_yes_no"), helper.RED)
+        if error_text is None:
+            error_text = helper.render_colored_text(
+                locale_manager.search_key("invalid_yes_no"), helper.RED
+            )
+        print(error_text)
@@ -0,0 +1,50 @@
+import subprocess
+from typing import Any
+
+from pytest import MonkeyPatch
+
+from BCSFE_Python import adb_handler
+
+
+def patch_subprocess(monkeypatch: MonkeyPatch) -> list[str]:
+    """Record the commands that would be run instead of running them"""
+    commands: list[str] = []
+
+    def run(command: str, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess:
+        commands.append(command)
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    return commands
+
+
+def test_rerun_game(monkeypatch: MonkeyPatch):
+    """Test that closing and starting the game is done with one adb shell call"""
+    commands = patch_subprocess(monkeypatch)
+    monkeypatch.setattr(adb_handler, "adb_ready", False)
+
+    adb_handler.rerun_game("en")
+    shell_commands = [command for command in commands if "shell" in command]
+    assert shell_commands == [
+        'adb shell "am force-stop jp.co.ponos.battlecatsen'
+        ' && monkey -p jp.co.ponos.battlecatsen -v 1"'
+    ]
+
+
+def test_adb_server_started_once(monkeypatch: MonkeyPatch):
+    """Test that the adb server is only started as root once until it is killed"""
+    commands = patch_subprocess(monkeypatch)
+    monkeypatch.setattr(adb_handler, "adb_ready", False)
+
+    adb_handler.run_adb_command("devices")
+    adb_handler.run_adb_command("devices")
+    assert commands == ["adb start-server", "adb root", "adb devices", "adb devices"]
+
+    adb_handler.adb_kill_server()
+    adb_handler.run_adb_command("devices")
+    assert commands[4:] == [
+        "adb kill-server",
+        "adb start-server",
+        "adb root",
+        "adb devices",
+    ]
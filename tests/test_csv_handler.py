@@ -0,0 +1,30 @@
+from BCSFE_Python import csv_handler
+
+
+def test_remove_comments():
+    """Test that comments, surrounding whitespace and empty lines are removed"""
+    data = "a,b//comment\r\n//whole line\n  c,d  \n\ne//x//y\n"
+    assert csv_handler.remove_comments(data) == "a,b\nc,d\ne"
+
+
+def test_parse_csv():
+    """Test that csv data is split into rows without empty items"""
+    data = "1,2,,3//comment\n\n4,5,\n//6,7\nname|x"
+    assert csv_handler.parse_csv(data) == [["1", "2", "3"], ["4", "5"], ["name|x"]]
+    assert csv_handler.parse_csv("a|b||c\n|", "|") == [["a", "b", "c"]]
+
+
+def test_parse_csv_interns_cells():
+    """Test that repeated cells share the same string object"""
+    data = csv_handler.parse_csv("".join(["-1", "2"]) + ",0\n" + "-1" + "2,0")
+    assert data[0][0] is data[1][0]
+    assert data[0][1] is data[1][1]
+
+
+def test_parse_csv_first_column():
+    """Test that the first column matches the first item of each parsed row"""
+    data = "a|b|c\n||d|e//comment\n|\n  f  \n//g|h\ni||j"
+    assert csv_handler.parse_csv_first_column(data, "|") == ["a", "d", "f", "i"]
+    assert csv_handler.parse_csv_first_column(data, "|") == [
+        row[0] for row in csv_handler.parse_csv(data, "|")
+    ]
@@ -186,3 +186,11 @@ def test_gatya_banner(monkeypatch: MonkeyPatch):
     ]
     actual_ids.sort()
     assert ids == actual_ids
+
+
+def test_filter_cat_names():
+    """Test that only the first form of each cat is kept"""
+
+    cat_names = [("a", 0, 0), ("b", 0, 1), ("c", 1, 0), ("d", 0, 2), ("e", 1, 1)]
+    filtered = cat_id_selector.filter_cat_names(cat_names)
+    assert filtered == [("a", 0, 0), ("c", 1, 0)]
@@ -0,0 +1,92 @@
+"""Test treasures"""
+
+from pytest import MonkeyPatch
+
+from BCSFE_Python.edits.levels import treasures
+
+
+def test_set_specific_treasures():
+    """Test that stage ids are mapped to the reversed treasure order"""
+
+    treasure_stats = [[0] * 49 for _ in range(10)]
+    treasure_data = [-1] * 48
+    treasure_data[0] = 1
+    treasure_data[45] = 2
+    treasure_data[46] = 3
+    treasure_data[47] = 1
+
+    treasure_stats = treasures.set_specific_treasures(treasure_stats, treasure_data, 4)
+    expected = [0] * 49
+    expected[45] = 1
+    expected[0] = 2
+    expected[46] = 3
+    expected[47] = 1
+    assert treasure_stats[4] == expected
+    assert treasure_stats[3] == [0] * 49
+
+
+def test_get_treasure_groups_cached(monkeypatch: MonkeyPatch):
+    """Test that the treasure groups are only downloaded once"""
+
+    calls: list[bool] = []
+
+    def get_stages(is_jp: bool) -> list[list[list[int]]]:
+        calls.append(is_jp)
+        return [[[0]]]
+
+    monkeypatch.setattr(treasures, "TREASURE_GROUPS", {})
+    monkeypatch.setattr(treasures, "get_stages", get_stages)
+    monkeypatch.setattr(treasures, "get_names", lambda is_jp: [[["name"]]])
+
+    groups = treasures.get_treasure_groups(False)
+    assert groups == {"names": [[["name"]]], "stages": [[[0]]]}
+    assert treasures.get_treasure_groups(False) is groups
+    assert calls == [False]
+
+
+def test_set_treasure_groups():
+    """Test that every stage in an edited group is set and skipped groups are kept"""
+
+    treasure_stats = [[0] * 49 for _ in range(10)]
+    treasure_grps = {"stages": [[[0, 1, 2], [3, 4]], [[5], [6, 7]]]}
+
+    treasure_stats = treasures.set_treasure_groups(
+        treasure_stats, treasure_grps, [None, 3], 1, 5
+    )
+    expected = [0] * 49
+    expected[6] = 3
+    expected[7] = 3
+    assert treasure_stats[5] == expected
+
+
+def test_set_treasures():
+    """Test that whole chapters are set, skipping the gap after EoC 3"""
+
+    treasure_stats = [[0] * 49 for _ in range(10)]
+    user_levels = [1, -1, -1, 2, -1, -1, -1, -1, 3]
+
+    treasure_stats = treasures.set_treasures(treasure_stats, user_levels)
+    assert treasure_stats[0] == [1] * 48 + [0]
+    assert treasure_stats[3] == [0] * 49
+    assert treasure_stats[4] == [2] * 48 + [0]
+    assert treasure_stats[9] == [3] * 48 + [0]
+
+
+def test_get_treasure_files(monkeypatch: MonkeyPatch):
+    """Test that concurrently downloaded files keep their order and fail together"""
+
+    def get_treasure_file(
+        pack_name: str, file_name: str, is_jp: bool, delimeter: str = ","
+    ):
+        if file_name == "missing.csv":
+            return None
+        return [[pack_name, file_name, delimeter]]
+
+    monkeypatch.setattr(treasures, "get_treasure_file", get_treasure_file)
+
+    files = treasures.get_treasure_files("DataLocal", ["a.csv", "b.csv"], False, "|")
+    assert files == [[["DataLocal", "a.csv", "|"]], [["DataLocal", "b.csv", "|"]]]
+    assert (
+        treasures.get_treasure_files("DataLocal", ["a.csv", "missing.csv"], False)
+        is None
+    )
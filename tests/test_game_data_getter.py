@@ -0,0 +1,55 @@
+from typing import Any
+
+import requests
+from pytest import MonkeyPatch
+
+from BCSFE_Python import game_data_getter
+
+
+class FakeResponse:
+    def __init__(self, text: str, ok: bool = True):
+        self.text = text
+        self.ok = ok
+
+
+def test_get_latest_versions_cached(monkeypatch: MonkeyPatch):
+    """Test that the latest versions are only requested once"""
+    urls: list[str] = []
+
+    def get(url: str, *args: Any, **kwargs: Any) -> FakeResponse:
+        urls.append(url)
+        return FakeResponse("120200en\n120200jp\n")
+
+    monkeypatch.setattr(game_data_getter, "latest_versions", None)
+    monkeypatch.setattr(requests, "get", get)
+
+    assert game_data_getter.get_latest_version(False) == "120200en"
+    assert game_data_getter.get_latest_version(True) == "120200jp"
+    assert urls == [game_data_getter.URL + "latest.txt"]
+
+
+def test_get_latest_versions_not_cached_on_error(monkeypatch: MonkeyPatch):
+    """Test that a failed request is retried on the next call"""
+
+    def get(url: str, *args: Any, **kwargs: Any) -> FakeResponse:
+        raise requests.exceptions.ConnectionError()
+
+    monkeypatch.setattr(game_data_getter, "latest_versions", None)
+    monkeypatch.setattr(requests, "get", get)
+
+    assert game_data_getter.get_latest_versions() is None
+    assert game_data_getter.latest_versions is None
+
+
+def test_get_latest_versions_not_cached_on_bad_status(monkeypatch: MonkeyPatch):
+    """Test that an error response is not cached"""
+
+    def get(url: str, *args: Any, **kwargs: Any) -> FakeResponse:
+        return FakeResponse("404: Not Found", ok=False)
+
+    monkeypatch.setattr(game_data_getter, "latest_versions", None)
+    monkeypatch.setattr(requests, "get", get)
+
+    assert game_data_getter.get_latest_versions() is None
+    assert game_data_getter.get_latest_version(True) is None
+    assert game_data_getter.latest_versions is None
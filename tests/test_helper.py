@@ -1,5 +1,7 @@
 """Test helper module"""
 
+import threading
+
 from BCSFE_Python import helper
 
 
@@ -17,3 +19,60 @@ def test_gv_to_str():
     assert helper.gv_to_str(110802) == "11.8.2"
     assert helper.gv_to_str(10700) == "1.7.0"
     assert helper.gv_to_str(108700) == "10.87.0"
+
+
+def test_split_text():
+    """Test that text is split on the split char, allowing for escaped split chars"""
+    assert helper.split_text("a&b&c") == ["a", "b", "c"]
+    assert helper.split_text("&a&") == ["", "a", ""]
+    assert helper.split_text("a\\&b&c") == ["a&b", "c"]
+    assert helper.split_text("a\\b") == ["a\\b"]
+    assert helper.split_text("a|b", "|") == ["a", "b"]
+
+
+def test_calculate_user_rank():
+    """Test that user rank counts unlocked cats and skips the second blue upgrade"""
+    save_stats = {
+        "cats": [1, 0, 1],
+        "cat_upgrades": {"Base": [2, 5, 3], "Plus": [1, 9, 0]},
+        "blue_upgrades": {"Base": [1, 2, 3], "Plus": [1, 1, 1]},
+    }
+    assert helper.calculate_user_rank(save_stats) == 16
+
+
+def test_split_text_plain():
+    """Test that text without a split char is returned as a single section"""
+    assert helper.split_text("plain text") == ["plain text"]
+    assert helper.split_text("") == [""]
+
+
+def test_clamp():
+    """Test that values are clamped between the min and max"""
+
+    assert helper.clamp(5, 0, 10) == 5
+    assert helper.clamp(-3, 0, 10) == 0
+    assert helper.clamp(11, 0, 10) == 10
+    assert helper.clamp(5, 7, 3) == 7
+
+
+def test_parse_int_list_list():
+    """Test that numbers are converted and other items are kept as strings"""
+
+    data = [["1", "-2", " 3"], [], ["4", "name", "5"]]
+    assert helper.parse_int_list_list(data) == [[1, -2, 3], [4, "name", 5]]
+
+
+def test_list_helpers():
+    """Test the small list conversion helpers"""
+
+    assert helper.offset_list([1, 2, 3], -1) == [0, 1, 2]
+    assert helper.copy_first_n([[1, 2], [3, 4], [5, 6]], 1) == [2, 4, 6]
+    assert helper.int_to_str_ls([1, 20, -3]) == ["1", "20", "-3"]
+
+
+def test_run_in_background():
+    """Test that background functions share state with the caller"""
+
+    done = threading.Event()
+    helper.run_in_background(done.set)
+    assert done.wait(5)
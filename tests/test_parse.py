@@ -1,7 +1,18 @@
 import os
+import struct
+from typing import Union
+
+from pytest import MonkeyPatch
+
 from BCSFE_Python import parse_save, patcher, serialise_save
 
 
+def load_save_data(monkeypatch: MonkeyPatch, data: Union[bytes, list[int]]):
+    """Point the parser at the data, restoring the parser state after the test"""
+    monkeypatch.setattr(parse_save, "save_data_g", bytes(data))
+    monkeypatch.setattr(parse_save, "address", 0)
+
+
 def test_parse():
     """Test parse save data"""
 
@@ -32,3 +43,156 @@ def run_testparse(file: str):
     save_stats = parse_save.parse_save(data_2, gv_c)
     data_3 = serialise_save.serialize_save(save_stats)
     assert data_2 == data_3 == data_1
+
+
+def test_main_story_round_trip(monkeypatch: MonkeyPatch):
+    """Test that main story chapters and treasures serialise back to the same data"""
+    story_chapters = {
+        "Chapter Progress": [chapter * 4 for chapter in range(10)],
+        "Times Cleared": [
+            [chapter + stage for stage in range(51)] for chapter in range(10)
+        ],
+    }
+    treasures = [
+        [(chapter + stage) % 4 for stage in range(49)] for chapter in range(10)
+    ]
+    data = serialise_save.serialise_main_story([], story_chapters)
+    data = serialise_save.serialise_treasures(data, treasures)
+
+    load_save_data(monkeypatch, data)
+    assert parse_save.get_main_story_levels() == story_chapters
+    assert parse_save.get_treasures() == treasures
+    assert parse_save.address == len(data)
+
+
+def test_get_length_doubles(monkeypatch: MonkeyPatch):
+    """Test that doubles are read in one go and the address is moved past them"""
+    data = serialise_save.write_length_doubles([], [1.5, -2.25, 3.0])
+    data = serialise_save.write_double(data, 4.75)
+
+    load_save_data(monkeypatch, data)
+    assert parse_save.get_length_doubles() == [1.5, -2.25, 3.0]
+    assert parse_save.get_double() == 4.75
+    assert parse_save.address == len(data)
+
+
+def test_cleared_slots_round_trip(monkeypatch: MonkeyPatch):
+    """Test that cleared stage line ups serialise back to the same data"""
+    cleared_slots = {
+        "slots": [
+            {
+                "cats": [
+                    {"cat_id": slot * 100 + cat, "cat_form": cat % 3}
+                    for cat in range(10)
+                ],
+                "slot_index": slot,
+                "separator": 0,
+            }
+            for slot in range(3)
+        ],
+        "slot_stages": [
+            {"slot_index": slot, "stages": [{"stage_id": slot * 1000 + 5}]}
+            for slot in range(2)
+        ],
+        "end_index": 2,
+    }
+    data = serialise_save.serialise_cleared_slots([], cleared_slots)
+    data = serialise_save.write(data, 0, 2)
+    data = serialise_save.write(data, 0, 4)
+
+    load_save_data(monkeypatch, data)
+    parsed, _ = parse_save.get_cleared_slots()
+    assert parsed == cleared_slots
+    assert parse_save.address == len(data)
+
+
+def test_time_data_round_trip(monkeypatch: MonkeyPatch):
+    """Test that time data serialises back to the same data"""
+    duplicate = {"yy": 2022, "mm": 3, "dd": 4}
+    data = serialise_save.serialise_time_data_skip(
+        [], "2022-03-04T05:06:07", 1646370367.5, True, duplicate, 1
+    )
+    data = serialise_save.serialise_time_data(data, "2021-12-31T23:59:58", True)
+
+    load_save_data(monkeypatch, data)
+    assert parse_save.get_time_data_skip(True) == {
+        "time": "2022-03-04T05:06:07",
+        "time_stamp": 1646370367.5,
+        "dst": 1,
+        "duplicate": duplicate,
+    }
+    assert parse_save.get_time_data(True) == "2021-12-31T23:59:58"
+    assert parse_save.address == len(data)
+
+
+def test_event_stages_round_trip(monkeypatch: MonkeyPatch):
+    """Test that event stage clears serialise back to the same data"""
+    lengths = {"total": 3, "stars": 4, "stages": 12, "unknown": 1}
+    event_stages = {
+        "Value": {
+            "clear_progress": [[i % 3] * 4 for i in range(3)],
+            "clear_amount": [
+                [[i + j + k for j in range(12)] for k in range(4)] for i in range(3)
+            ],
+            "unlock_next": [[i % 2] * 4 for i in range(3)],
+        },
+        "Lengths": lengths,
+    }
+    data = serialise_save.serialise_event_stages([], event_stages)
+
+    load_save_data(monkeypatch, data)
+    assert parse_save.get_event_stages(lengths) == event_stages
+    assert parse_save.address == len(data)
+
+
+def test_missions_and_talents_round_trip(monkeypatch: MonkeyPatch):
+    """Test that id/value pairs serialise back to the same data"""
+    missions = {mission_id: mission_id * 3 for mission_id in range(0, 40, 4)}
+    talents = {
+        cat_id: [{"id": talent, "level": cat_id % 10} for talent in range(5)]
+        for cat_id in (10, 25, 300)
+    }
+    data = serialise_save.serialise_mission_segment([], missions)
+    data = serialise_save.serialise_talent_data(data, talents)
+
+    load_save_data(monkeypatch, data)
+    assert parse_save.get_mission_segment() == missions
+    assert parse_save.get_talent_data() == talents
+    assert parse_save.address == len(data)
+
+
+def test_outbreaks_and_medals_round_trip(monkeypatch: MonkeyPatch):
+    """Test that outbreak and medal flags serialise back to the same data"""
+    outbreaks = {
+        chapter_id: {stage_id: stage_id % 2 for stage_id in range(48)}
+        for chapter_id in (0, 1, 2, 4)
+    }
+    medals = {"medal_data_1": [1, 2, 3], "medal_data_2": {5: 1, 70: 0, 300: 1}}
+    data = serialise_save.serialise_outbreaks([], outbreaks)
+    data = serialise_save.serialise_medals(data, medals)
+
+    load_save_data(monkeypatch, data)
+    assert parse_save.get_outbreaks() == outbreaks
+    assert parse_save.get_medals() == medals
+    assert parse_save.address == len(data)
+
+
+def test_struct_data_end_of_buffer(monkeypatch: MonkeyPatch):
+    """Test that a truncated fixed layout block reads missing ints as 0"""
+    load_save_data(monkeypatch, struct.pack("<3I", 1, 2, 3) + b"\x04")
+    data = parse_save.get_struct_data(struct.Struct("<2I3H"))
+    assert data == (1, 2, 3, 0, 4)
+    assert parse_save.address == 14
+    parse_save.set_address(8)
+    assert parse_save.get_struct_data(struct.Struct("<2i")) == (3, 4)
+    parse_save.set_address(0)
+    treasures = parse_save.get_treasures()
+    assert treasures[0][:3] == [1, 2, 3]
+    assert treasures[0][3] == 4
+    assert treasures[9] == [0] * 49
+
+
+def test_dict_end_of_buffer(monkeypatch: MonkeyPatch):
+    """Test that a dict count past the end of the buffer reads missing ints as 0"""
+    load_save_data(monkeypatch, struct.pack("<3I", 3, 1, 2))
+    assert parse_save.get_dict(int, int) == {1: 2, 0: 0}